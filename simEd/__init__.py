@@ -6,6 +6,7 @@ from .generators.generators_discrete import vbinom
 # define what gets imported with "from simEd import *"
 __all__ = ['set_seed', 'vexp', 'vunif', 'vbinom']
 
-# hide internal modules from dir() and tab completion
+# hide internal modules from dir() and tab completion (importing a submodule
+# binds its top-level subpackage, e.g. generators, as an attribute here)
 del generators
 del utils
@@ -4,7 +4,7 @@ from .rng_mt19937 import rng
 ################################################################################
 # SET THE INITIAL STATE OF THE RNG 
 #   if no seed: fresh, unpredictable entropy will be pulled from the OS
-#   https://numpy.org/doc/2.2/reference/random/bit_generators/mt19937.html
+#   https://numpy.org/doc/2.2/reference/random/bit_generators/pcg64dxsm.html
 rng.set_seed(None)  # default rng state will be "fresh, unpredictable entropy"
 
 from .generators            import set_seed, _generateUniforms
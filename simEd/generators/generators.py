@@ -1,8 +1,9 @@
-from rng_mt19937 import rng
+from .rng_mt19937 import rng
 from ..utils._error_checks import _checkType
+import numpy.typing
 ################################################################################
 def set_seed(seed: int | None = None) -> None:
-    ''' function to set the state of the MT19937 generator and its streams
+    ''' function to set the state of the PCG64DXSM generator and its streams
     Parameters:
         seed: an integer initial seed, or None for system-supplied state
     '''
@@ -10,28 +11,63 @@ def set_seed(seed: int | None = None) -> None:
     rng.set_seed(seed)
 
 ################################################################################
+# NB: every generator inverts the U(0,1) variates produced here, even when the
+# caller wants only the variates, rather than calling numpy's native samplers
+# (e.g., Generator.exponential, normal, binomial) -- those consume the stream
+# differently (ziggurat, rejection), so antithetic pairs would lose their
+# negative correlation and common random numbers would fall out of sync across
+# distributions; the inversion is instead kept cheap by fusing it in place
 def _generateUniforms(n: int,
                       stream: int = 0, 
                       antithetic: bool = False
-                     ) -> float | list[float]:
+                     ) -> float | numpy.typing.NDArray[numpy.float64]:
     ''' private method for generating scalar or vector of U(0,1) variates
     Parameters:
         n: number of variates to generate
         stream: integer stream in [0,127]
         antithetic: if True, uses 1-u
     Returns:
-        a scalar or list of U(0,1) variates so generated
+        a scalar or float64 array of U(0,1) variates so generated
     '''
-    if n == 1:
-        # generate a single variate via R's qunif-style inversion
-        u: float = rng.uniform(a = 0, b = 1, which_stream = stream)
-        if antithetic: u = 1 - u
-    else:
-        # generate multiple variates via R's qunif-style inversion
-        u: list[float] = []
-        for _ in range(n):
-            u_val = rng.uniform(a = 0, b = 1, which_stream = stream)
-            if antithetic: u_val = 1 - u_val
-            u.append(u_val)
-    return u
+    # generate all variates in one bulk call straight into a preallocated
+    # buffer (R's qunif-style inversion is applied downstream), flipping them
+    # in place if antithetic
+    u = numpy.empty(n, dtype = numpy.float64)
+    rng.uniforms(n, which_stream = stream, out = u)
+    if antithetic: numpy.subtract(1.0, u, out = u)
+    return u if n > 1 else float(u[0])
+
+################################################################################
+def _inversionBuffer(u: float | numpy.typing.NDArray[numpy.float64],
+                     copy: bool = False
+                    ) -> numpy.typing.NDArray[numpy.float64] | None:
+    ''' private method for choosing where a chain of ufuncs should write the
+        variates obtained by inverting u, so that no temporaries are allocated
+    Parameters:
+        u: scalar or array of U(0,1) variates from _generateUniforms
+        copy: if True, u must survive inversion (e.g., to be returned as_dict)
+    Returns:
+        None if u is a scalar (ufuncs then simply return a scalar), a fresh
+        array shaped like u if copy, or otherwise u itself to invert in place
+    '''
+    if isinstance(u, float): return None
+    return numpy.empty_like(u) if copy else u
 
+################################################################################
+def _formatVariates(x: float | numpy.typing.NDArray,
+                    n: int,
+                    out_format: str = 'ndarray'
+                   ) -> float | int | numpy.typing.NDArray | list:
+    ''' private method for putting variates into the form returned by the
+        public generators
+    Parameters:
+        x: scalar or array of variates
+        n: number of variates
+        out_format: 'ndarray' to return an array as-is, or 'list' to convert
+            it to a list
+    Returns:
+        a Python scalar if n is 1; otherwise, x or x as a list per out_format
+    '''
+    if n == 1:
+        return x.item() if isinstance(x, numpy.generic | numpy.ndarray) else x
+    return x.tolist() if out_format == 'list' else x
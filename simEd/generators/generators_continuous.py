@@ -1,19 +1,12 @@
-# use scipy for R-style quantile inversion via ppf function
-# https://docs.scipy.org/doc/scipy/reference/stats.html#continuous-distributions
-from scipy.stats import beta, \
-                        cauchy, \
-                        chisquare, \
-                        expon, \
-                        gamma, \
-                        lognorm, \
-                        logistic, \
-                        norm, \
-                        t, \
-                        uniform, \
-                        weibull_min as weibull
-
-from .generators import rng, _generateUniforms
-from ..utils._error_checks import _checkType, _checkRange
+# R-style quantile inversion is done directly with numpy ufuncs (and, for the
+# normal, scipy.special's ndtri), so no scipy.stats distributions are imported
+# here; scipy.special is imported lazily by the generator that needs it,
+# keeping import simEd fast
+import numpy
+from typing import Literal
+
+from .generators import rng, _generateUniforms, _inversionBuffer, _formatVariates
+from ..utils._error_checks import _checkType, _checkNumeric, _checkRange
 ################################################################################
 def vunif(n:          int, 
           min_:       float = 0.0, 
@@ -21,7 +14,8 @@ def vunif(n:          int,
           stream:     int   = 0,
           antithetic: bool  = False,
           as_dict:    bool  = False,
-         ) -> float | list[float] | dict[list[float], list[float]]:
+          out_format: Literal['ndarray', 'list'] = 'ndarray',
+         ) -> float | numpy.ndarray | list[float] | dict[str, numpy.ndarray | list[float]]:
     ''' variate generator for the uniform distribution
     Parameters:
         n:          number of observations
@@ -32,36 +26,51 @@ def vunif(n:          int,
             otherwise, uses 1 - u
         as_dict:    if False (default) return only the generated random
             variates; otherwise, return a dictionary with components suitable
-            for visualizing inversion: "u" is a list of generated U(0,1)
-            variates, and "x" is a list of inverted U(min_,max_) variates
+            for visualizing inversion: "u" holds the generated U(0,1)
+            variates, and "x" holds the inverted U(min_,max_) variates
+        out_format: if 'ndarray' (default), multiple variates are returned as
+            a numpy array; if 'list', as a list (a single variate is always
+            returned as a scalar)
     Returns:
-        a single U(min_,max_) generated variate, or a list of such variates, or
-        a dictionary with keys "u" and "x" whose values are lists corresponding
-        to the generated U(0,1) variates and the inverted U(min_,max_) variates
+        a single U(min_,max_) generated variate, or an array (or list) of such
+        variates, or a dictionary with keys "u" and "x" whose values are arrays
+        (or lists) corresponding to the generated U(0,1) variates and the
+        inverted U(min_,max_) variates
     '''
     for _ in [n, stream]:  _checkType(_, int)
     for _ in [min_, max_]: _checkType(_, float)
     for _ in [antithetic, as_dict]: _checkType(_, bool)
-
-    max_stream = rng.numStreams() - 1
-    _checkRange(n,      min_ = 1,                       msg = f"vunif: must generate at least one variate")
+    _checkType(out_format, str)
+    if out_format not in ('ndarray', 'list'):
+        raise ValueError(f"vunif: out_format must be 'ndarray' or 'list'")
+
+    # n and stream are checked inline, as they are on every call's hot path
+    if n < 1: raise ValueError("vunif: must generate at least one variate")
+    if not 0 <= stream <= rng._max_stream:
+        raise ValueError(f"vunif: stream must be in [0,{rng._max_stream}]")
     _checkRange(max_,   min_ = min_,                    msg = f"vunif: must have min_ <= max_")
-    _checkRange(stream, min_ = 0,    max_ = max_stream, msg = f"vunif: stream must be in [0,{max_stream}]")
-
-    # generate the scalar or list of U(0,1) variates for inverting
-    u: float | list[float] = _generateUniforms(n, stream, antithetic)
 
-    # use scipy.stat's uniform.ppf (percent point function) a la R's qunif to
-    # invert u:
-    # https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.uniform.html
-    # "Using the parameters loc and scale, one obtains the uniform distribution
-    #  on [loc, loc + scale]." <-- a bit odd for uniform, but oh well
-    #
-    # NB: if u is scalar, numpy's tolist() defaults to float 
-    x: float | list[float] = uniform.ppf(u, loc = min_, scale = max_ - min_).tolist()
+    # generate the scalar or array of U(0,1) variates for inverting
+    u: float | numpy.ndarray = _generateUniforms(n, stream, antithetic)
+
+    # invert u a la R's qunif; the uniform ppf is simply affine, so compute
+    # min_ + (max_ - min_) * u directly (in place, as in vexp) rather than
+    # round-tripping through scipy.stat's uniform.ppf and its masking/copying;
+    # for U(0,1) there is nothing to invert at all (unless x must be kept
+    # separate from u for as_dict)
+    if min_ == 0.0 and max_ == 1.0 and not as_dict:
+        x = u
+    else:
+        out = _inversionBuffer(u, copy = as_dict)
+        x = numpy.multiply(u, max_ - min_, out = out)
+        x = numpy.add(x, min_, out = out)
+
+    # NB: a single variate is returned as a Python float, and an array of
+    # variates is converted to a list only if out_format asks for one
+    x = _formatVariates(x, n, out_format)
 
     # return a dictionary of u and x variates;
-    if as_dict: return {"u":u, "x":x}
+    if as_dict: return {"u":_formatVariates(u, n, out_format), "x":x}
 
     # otherwise, return the x variates only
     return x
@@ -73,7 +82,8 @@ def vexp(n:          int,
          stream:     int   = 0,
          antithetic: bool  = False,
          as_dict:    bool  = False,
-        ) -> float | list[float] | dict[list[float], list[float]]:
+         out_format: Literal['ndarray', 'list'] = 'ndarray',
+        ) -> float | numpy.ndarray | list[float] | dict[str, numpy.ndarray | list[float]]:
     ''' variate generator for the exponential distribution
     Parameters:
         n:          number of observations
@@ -83,39 +93,51 @@ def vexp(n:          int,
             otherwise, uses 1 - u
         as_dict:    if False (default) return only the generated random
             variates; otherwise, return a dictionary with components suitable
-            for visualizing inversion: "u" is a list of generated U(0,1)
-            variates, and "x" is a list of inverted exp(rate) variates
+            for visualizing inversion: "u" holds the generated U(0,1)
+            variates, and "x" holds the inverted exp(rate) variates
+        out_format: if 'ndarray' (default), multiple variates are returned as
+            a numpy array; if 'list', as a list (a single variate is always
+            returned as a scalar)
     Returns:
-        a single generated exponential variate, or a list of such variates, or
-        a dictionary with keys "u" and "x" whose values are lists corresponding
-        to the generated U(0,1) variates and the inverted exponential variates
-        with corresponding rate
+        a single generated exponential variate, or an array (or list) of such
+        variates, or a dictionary with keys "u" and "x" whose values are arrays
+        (or lists) corresponding to the generated U(0,1) variates and the
+        inverted exponential variates with corresponding rate
     '''
     for _ in [n, stream]:  _checkType(_, int)
-    _checkType(rate, float | int)
+    _checkNumeric(rate, 'rate')
     for _ in [antithetic, as_dict]: _checkType(_, bool)
-
-    max_stream = rng.numStreams() - 1
-    _checkRange(n,      min_ = 1, msg = f"vexp: must generate at least one variate")
+    _checkType(out_format, str)
+    if out_format not in ('ndarray', 'list'):
+        raise ValueError(f"vexp: out_format must be 'ndarray' or 'list'")
+
+    # n and stream are checked inline, as they are on every call's hot path
+    if n < 1: raise ValueError("vexp: must generate at least one variate")
+    if not 0 <= stream <= rng._max_stream:
+        raise ValueError(f"vexp: stream must be in [0,{rng._max_stream}]")
     _checkRange(rate,   min_ = 0, msg = f"vexp: must have rate > 0", include_min = False)
-    _checkRange(stream, min_ = 0, max_ = max_stream, msg = f"vexp: stream must be in [0,{max_stream}]")
 
-    # generate the scalar or list of U(0,1) variates for inverting
-    u: float | list[float] = _generateUniforms(n, stream, antithetic)
+    # generate the scalar or array of U(0,1) variates for inverting
+    u: float | numpy.ndarray = _generateUniforms(n, stream, antithetic)
 
-    # use scipy.stat's expon.ppf (percent point function) a la R's qunif:
+    # invert u a la R's qexp; the exponential ppf with rate lambda is
+    # -log(1 - u) / lambda, computed via log1p for accuracy near u = 0 and
+    # without scipy.stat's expon.ppf dispatch overhead:
     # https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.expon.html
-    # "A common parameterization for expon is in terms of the rate parameter
-    #  lambda, such that pdf = lambda * exp(-lambda * x). This parameterization
-    #  corresponds to using scale = 1 / lambda.
-    # "Using the parameters loc and scale, one obtains the uniform distribution
-    #  on [loc, loc + scale]." <-- a bit odd for uniform, but oh well
     #
-    # NB: if u is scalar, numpy's tolist() defaults to float 
-    x: float | list[float] = expon.ppf(u, scale = 1 / rate).tolist()
+    # each ufunc writes into the same buffer (u itself unless it is needed
+    # for as_dict), so the variates are touched once per step w/o temporaries
+    out = _inversionBuffer(u, copy = as_dict)
+    x = numpy.negative(u, out = out)
+    x = numpy.log1p(x, out = out)
+    x = numpy.divide(x, -rate, out = out)
+
+    # NB: a single variate is returned as a Python float, and an array of
+    # variates is converted to a list only if out_format asks for one
+    x = _formatVariates(x, n, out_format)
 
     # return a dictionary of u and x variates;
-    if as_dict: return {"u":u, "x":x}
+    if as_dict: return {"u":_formatVariates(u, n, out_format), "x":x}
 
     # otherwise, return the x variates only
     return x
@@ -128,25 +150,45 @@ def vnorm(n: int,
           sd: float = 1.0,
           stream: int = 0,
           antithetic: bool = False,
-          as_dict: bool = False) -> float | list[float] | dict[list[float], list[float]]:
+          as_dict: bool = False,
+          out_format: Literal['ndarray', 'list'] = 'ndarray',
+         ) -> float | numpy.ndarray | list[float] | dict[str, numpy.ndarray | list[float]]:
    
     for _ in [n, stream]: _checkType(_, int)
-    _checkType(mean, float | int)
-    _checkType(sd, float | int)
-    for _ in [antithetic, as_dict]: _checkType(antithetic, bool)
-    
-
-    max_stream = rng.numStreams() - 1
-    _checkRange(n,      min_ = 1, msg = f"vnorm: must generate at least one variate")
+    _checkNumeric(mean, 'mean')
+    _checkNumeric(sd, 'sd')
+    for _ in [antithetic, as_dict]: _checkType(_, bool)
+    _checkType(out_format, str)
+    if out_format not in ('ndarray', 'list'):
+        raise ValueError(f"vnorm: out_format must be 'ndarray' or 'list'")
+
+    # n and stream are checked inline, as they are on every call's hot path
+    if n < 1: raise ValueError("vnorm: must generate at least one variate")
+    if not 0 <= stream <= rng._max_stream:
+        raise ValueError(f"vnorm: stream must be in [0,{rng._max_stream}]")
     _checkRange(sd,   min_ = 0, msg = f"vnorm: must have sd > 0", include_min = False)
-    _checkRange(stream, min_ = 0, max_ = max_stream, msg = f"vnorm: stream must be in [0,{max_stream}]")
     
-    u: float | list[float] = _generateUniforms(n, stream, antithetic)
+    u: float | numpy.ndarray = _generateUniforms(n, stream, antithetic)
+
+    # invert u a la R's qnorm via the standard normal quantile ndtri, then
+    # scale and shift in place -- equivalent to norm.ppf(u, loc = mean, scale = sd)
+    from scipy.special import ndtri  # deferred; see top of file
 
-    x: float | list[float] = norm.ppf(u, loc = mean, scale = sd).tolist()
+    out = _inversionBuffer(u, copy = as_dict)
+    x = ndtri(u, out = out)
+    x = numpy.multiply(x, sd, out = out)
+    x = numpy.add(x, mean, out = out)
+
+    x = _formatVariates(x, n, out_format)
 
     if as_dict:
-        return {"u": u, "x": x}
+        return {"u": _formatVariates(u, n, out_format), "x": x}
     return x
 
-vnorm(10, 2.5, 0, -1, True, True)
\ No newline at end of file
+################################################################################
+if __name__ == "__main__":
+    # run from the repository root via: python -m simEd.generators.generators_continuous
+    print(vnorm(10, 2.5, 1.0, 0, True, True))
+
+    try: vnorm(10, 2.5, 0, -1, True, True)  # sd and stream out of range
+    except Exception as err: print(err)
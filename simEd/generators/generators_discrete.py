@@ -1,11 +1,10 @@
-# use scipy for R-style quantile inversion via ppf function
+# use scipy for R-style quantile inversion via ppf function; scipy.stats is
+# imported lazily by the generator that needs it, as importing it is slow
 # https://docs.scipy.org/doc/scipy/reference/stats.html#discrete-distributions
-from scipy.stats import binom, \
-                        geom, \
-                        nbinom, \
-                        poisson
+import numpy
+from typing import Literal
 
-from ..generators import rng, _generateUniforms
+from .generators import rng, _generateUniforms, _formatVariates
 from ..utils._error_checks import _checkType, _checkRange
 
 ################################################################################
@@ -15,7 +14,8 @@ def vbinom(n:          int,
            stream:     int   = 0,
            antithetic: bool  = False,
            as_dict:    bool  = False,
-        ) -> int | list[int] | dict[list[float], list[int]]:
+           out_format: Literal['ndarray', 'list'] = 'ndarray',
+        ) -> int | numpy.ndarray | list[int] | dict[str, numpy.ndarray | list]:
     ''' variate generator for the binomial distribution
     Parameters:
         n:          number of observations
@@ -26,37 +26,52 @@ def vbinom(n:          int,
             otherwise, uses 1 - u
         as_dict:    if False (default) return only the generated random
             variates; otherwise, return a dictionary with components suitable
-            for visualizing inversion: "u" is a list of generated U(0,1)
-            variates, and "x" is a list of inverted binom(size,prob) variates
+            for visualizing inversion: "u" holds the generated U(0,1)
+            variates, and "x" holds the inverted binom(size,prob) variates
+        out_format: if 'ndarray' (default), multiple variates are returned as
+            a numpy array; if 'list', as a list (a single variate is always
+            returned as a scalar)
     Returns:
-        a single generated binomial variate, or a list of such variates, or
-        a dictionary with keys "u" and "x" whose values are lists corresponding
-        to the generated U(0,1) variates and the inverted binomial variates
-        with corresponding size and probability
+        a single generated binomial variate, or an array (or list) of such
+        variates, or a dictionary with keys "u" and "x" whose values are arrays
+        (or lists) corresponding to the generated U(0,1) variates and the
+        inverted binomial variates with corresponding size and probability
     '''
     for _ in [n, size, stream]: _checkType(_, int)
     _checkType(prob, float)
     for _ in [antithetic, as_dict]: _checkType(_, bool)
+    _checkType(out_format, str)
+    if out_format not in ('ndarray', 'list'):
+        raise ValueError(f"vbinom: out_format must be 'ndarray' or 'list'")
 
-    max_stream = rng.numStreams() - 1
-    _checkRange(n,      min_ = 1,                    msg = f"vbinom: must generate at least one variate")
+    # n and stream are checked inline, as they are on every call's hot path
+    if n < 1: raise ValueError("vbinom: must generate at least one variate")
+    if not 0 <= stream <= rng._max_stream:
+        raise ValueError(f"vbinom: stream must be in [0,{rng._max_stream}]")
     _checkRange(size,   min_ = 0,                    msg = f"vbinom: number of trials must be >= 0")
     _checkRange(prob,   min_ = 0, max_ = 1,          msg = f"vbinom: must have 0 < prob <= 1", include_min = False)
-    _checkRange(stream, min_ = 0, max_ = max_stream, msg = f"vexp: stream must be in [0,{max_stream}]")
 
-    # generate the scalar or list of U(0,1) variates for inverting
-    u: float | list[float] = _generateUniforms(n, stream, antithetic)
+    # generate the scalar or array of U(0,1) variates for inverting
+    u: float | numpy.ndarray = _generateUniforms(n, stream, antithetic)
 
-    # use scipy.stat's binom.ppf (percent point function) a la R's qunif:
+    from scipy.stats import binom  # deferred; see top of file
+
+    # use scipy.stat's binom._ppf (percent point function) a la R's qbinom;
+    # calling the private _ppf skips rv_discrete.ppf's generic argument
+    # broadcasting and domain checks, which we have already done above, while
+    # still using scipy's compiled (boost) binomial quantile:
     # https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.binom.html
     # "binom takes n and p and as shape parameters, where p is the probability
     #  of a single success and 1-p is the probability of a single failure."
-    #
-    # NB: if u is scalar, numpy's tolist() defaults to int
-    x: int | list[int] = binom.ppf(u, n = size, p = prob).astype('int').tolist()
+    # (NB: unlike binom.ppf, which returns -1 at u == 0, _ppf returns 0 there)
+    x = binom._ppf(u, size, prob)
+
+    # NB: a single variate is returned as a Python int, and an array of
+    # variates is converted to a list only if out_format asks for one
+    x = _formatVariates(x.astype('int'), n, out_format)
 
     # return a dictionary of u and x variates;
-    if as_dict: return {"u":u, "x":x}
+    if as_dict: return {"u":_formatVariates(u, n, out_format), "x":x}
 
     # otherwise, return the x variates only
     return x
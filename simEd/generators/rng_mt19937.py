@@ -1,11 +1,11 @@
 import numpy.typing
 
-# use numpy.random's MT19937 for random-number generation w/ streams
-from numpy.random import MT19937, Generator, SeedSequence
+# use numpy.random's PCG64DXSM for random-number generation w/ streams
+from numpy.random import PCG64DXSM, Generator, SeedSequence
 
 ######################################################################
 class rng:
-    ''' This class implements a wrapper around numpy's MT19937 generator
+    ''' This class implements a wrapper around numpy's PCG64DXSM generator
         to allow for a streams implementation, i.e., where we can have a
         different stream of random numbers for each different stochastic
         component.  
@@ -16,7 +16,9 @@ class rng:
 
     # class-level variables
     _num_streams: int = 128  # arbitrary
-    _streams:     list[numpy.random.Generator] = [None] * _num_streams
+    _max_stream:  int = _num_streams - 1  # precomputed for hot-path checks
+    _seeds:       list[SeedSequence] = []  # one per stream, set by set_seed
+    _streams:     list[numpy.random.Generator | None] = [None] * _num_streams
 
     ############################################################################
     @classmethod
@@ -25,15 +27,33 @@ class rng:
     ############################################################################
     @classmethod
     def set_seed(cls, seed: int | None = None) -> None:
-        # https://numpy.org/doc/stable/reference/random/bit_generators/mt19937.html
+        # https://numpy.org/doc/stable/reference/random/parallel.html
+        # spawn one independent child SeedSequence per stream rather than
+        # chaining jumped() BitGenerators, which is costly for each stream;
+        # the Generators themselves are only built when a stream is first used;
+        # the children are spawned afresh on every call (not cached per seed),
+        # since Generator.spawn() mutates a child SeedSequence, and re-seeding
+        # must reproduce such spawned generators exactly
         seed_seq = SeedSequence(seed)
-        bit_generator = MT19937(seed_seq)
-        
-        for i in range(cls._num_streams):
-            cls._streams[i] = Generator(bit_generator)
-            # chain the BitGenerators
-            bit_generator = bit_generator.jumped()
-        
+        cls._seeds   = seed_seq.spawn(cls._num_streams)
+        cls._streams = [None] * cls._num_streams
+
+    ############################################################################
+    @classmethod
+    def _stream(cls, which_stream: int) -> numpy.random.Generator:
+        ''' class-level method to fetch a stream's Generator, constructing it
+            from the stream's seed on first use
+        Parameters:
+            which_stream: integer value of stream in [0, rng.numStreams() - 1]
+        Returns:
+            the numpy Generator for the given stream
+        '''
+        generator = cls._streams[which_stream]
+        if generator is None:
+            generator = Generator(PCG64DXSM(cls._seeds[which_stream]))
+            cls._streams[which_stream] = generator
+        return generator
+
     ############################################################################
     @classmethod
     def uniform(cls, a: float, b: float, which_stream: int = 0) -> numpy.float64:
@@ -46,6 +66,49 @@ class rng:
         Returns:
             a uniformly generated floating point value in either [a,b) or (a,b)
         '''
-        return cls._streams[which_stream].uniform(a,b)
+        return cls._stream(which_stream).uniform(a,b)
+
+    ############################################################################
+    @classmethod
+    def uniforms(cls,
+                 n:            int,
+                 which_stream: int = 0,
+                 out:          numpy.typing.NDArray[numpy.float64] | None = None
+                ) -> numpy.typing.NDArray[numpy.float64]:
+        ''' class-level method to generate n floating-point values uniformly
+            in [0,1) in a single call into numpy
+        Parameters:
+            n: number of values to generate
+            which_stream: integer value of stream in [0, rng.numStreams() - 1]
+            out: optional preallocated contiguous float64 array of size n into
+                which the values are written directly
+        Returns:
+            a contiguous float64 array of n uniformly generated values in [0,1)
+            (out itself, if given)
+        '''
+        return cls._stream(which_stream).random(n, out = out)
 
+    ############################################################################
+    @classmethod
+    def uniforms_multistream(cls, n: int, streams: list[int]) -> numpy.typing.NDArray[numpy.float64]:
+        ''' class-level method to generate n floating-point values uniformly
+            in [0,1) from each of several streams, in a single call
+        Parameters:
+            n: number of values to generate per stream
+            streams: integer values of streams, each in [0, rng.numStreams() - 1]
+        Returns:
+            a (len(streams), n) float64 array whose i-th row holds the values
+            generated from streams[i]
+        Raises:
+            ValueError if any stream is outside [0, rng.numStreams() - 1]
+        '''
+        # check up front, since list indexing would silently wrap negatives
+        for which_stream in streams:
+            if not 0 <= which_stream <= cls._max_stream:
+                raise ValueError(f"uniforms_multistream: stream must be in [0,{cls._max_stream}]")
 
+        # each Generator fills its row of one preallocated buffer directly
+        out = numpy.empty((len(streams), n), dtype = numpy.float64)
+        for i, which_stream in enumerate(streams):
+            cls.uniforms(n, which_stream, out = out[i])
+        return out
@@ -1,24 +1,50 @@
-import inspect
+import functools
 import numpy.typing
+import sys
 import types
 
 ################################################################################
-def _checkTypeMap(obj: object, type_: type) -> bool:
-    type_map = {
-        numpy.integer:         int,       # equate int & numpy.integer
-        numpy.floating:        float,
-        numpy.complexfloating: complex,
-        numpy.bool_:           bool,
-        numpy.str_:            str,
-        numpy.object_:         object,
-        float:                 int,       # allow an int to act as float
-        int:                   int        # for UnionType w/ int (see parsing in checkType)
-    }
-    if type_ in type_map or type(obj) in type_map:
-        bad_type = not isinstance(obj, (type_, type_map[type_]))
-    else:
-        bad_type = not isinstance(obj, type_)
-    return bad_type
+def _callerInfo() -> tuple[str, int]:
+    ''' function to identify the caller of a checking function, for use in
+        error messages only (i.e., never on the success path)
+    Returns:
+        a tuple of the name and current line number of the function that
+        called the checking function that called this one
+    '''
+    # sys._getframe is O(1), unlike inspect.stack(), which walks every frame
+    # and reads source files from disk
+    caller_frame = sys._getframe(2)
+    return caller_frame.f_code.co_name, caller_frame.f_lineno
+
+################################################################################
+# types that each key type also accepts when type checking
+_TYPE_MAP: dict[type, type] = {
+    numpy.integer:         int,       # equate int & numpy.integer
+    numpy.floating:        float,
+    numpy.complexfloating: complex,
+    numpy.bool_:           bool,
+    numpy.str_:            str,
+    numpy.object_:         object,
+    float:                 int,       # allow an int to act as float
+    int:                   numpy.integer  # ... in both directions
+}
+
+@functools.lru_cache(maxsize = 64)
+def _acceptedTypes(type_: type | types.UnionType) -> tuple[type, ...]:
+    ''' function to flatten a type or UnionType into the tuple of concrete
+        types it accepts (per _TYPE_MAP), cached since the same few types and
+        unions (e.g., int | float) are checked on every generator call
+    Parameters:
+        type_: a Python type or UnionType of types (via |)
+    Returns:
+        a tuple of types suitable for passing to isinstance
+    '''
+    args = type_.__args__ if isinstance(type_, types.UnionType) else (type_,)
+    accepted = []
+    for t in args:
+        accepted.append(t)
+        if t in _TYPE_MAP: accepted.append(_TYPE_MAP[t])
+    return tuple(dict.fromkeys(accepted))  # remove duplicates, keep order
 
 def _checkType(obj: object, type_: type | types.UnionType) -> None:
     ''' function to check the type of a given object, raising
@@ -29,23 +55,38 @@ def _checkType(obj: object, type_: type | types.UnionType) -> None:
     Raises:
         TypeError if any given object is not of the given type_
     '''
-    if isinstance(type_, types.UnionType):
-        good_type = False
-        for t in type_.__args__:
-            good_type |= not _checkTypeMap(obj, t)
-        bad_type = not good_type
+    if type_ is int:  # most common check, so skip the general dispatch
+        bad_type = not isinstance(obj, (int, numpy.integer))
     else:
-        bad_type = _checkTypeMap(obj, type_)
+        bad_type = not isinstance(obj, _acceptedTypes(type_))
 
     if bad_type:
-        caller_frame = inspect.stack()[1]
-        caller_name  = caller_frame.function
-        line_num     = caller_frame.lineno
+        caller_name, line_num = _callerInfo()
         try:    type_name = type_.__name__
         except: type_name = type_  # UnionType
         msg = f"function '{caller_name}:{line_num}' requires type {type_name}, not {type(obj).__name__}"
         raise TypeError(msg)
 
+################################################################################
+# concrete types accepted wherever a real number is expected
+_NUMERIC: tuple[type, ...] = (int, float, numpy.integer, numpy.floating)
+
+def _checkNumeric(obj: object, name: str) -> None:
+    ''' function to check that a given object is a real number, raising
+        meaningful TypeError if not; a specialized, faster alternative to
+        _checkType(obj, int | float) for the generators' hot paths
+    Parameters:
+        obj:  any python object
+        name: name of the parameter being checked, for the error message
+    Raises:
+        TypeError if the given object is not an int, float, or numpy
+        integer or floating-point value
+    '''
+    if not isinstance(obj, _NUMERIC):
+        caller_name, line_num = _callerInfo()
+        msg = f"function '{caller_name}:{line_num}' requires numeric {name}, not {type(obj).__name__}"
+        raise TypeError(msg)
+
 ################################################################################
 def _checkRange(obj:         int | float, 
                min_:        int | float | None = None, 
@@ -69,19 +110,17 @@ def _checkRange(obj:         int | float,
     Raises:
         TypeError if any given object is not of the given type_
     '''
-    if min_ is not None: _checkType(obj, int | float)
-    if max_ is not None: _checkType(obj, int | float)
+    if min_ is not None or max_ is not None: _checkNumeric(obj, "value")
     for _ in [include_min, include_max]: _checkType(_, bool)
-    caller_frame = inspect.stack()[1]
-    caller_name  = caller_frame.function
-    line_num     = caller_frame.lineno
     if min_ is not None:
         if (include_min and obj < min_) or (not include_min and obj <= min_):
+            caller_name, line_num = _callerInfo()
             gt = '>=' if include_min else '>'
             msg = msg if msg is not None else f"function '{caller_name}:{line_num}' requires {obj} {gt} {min_}"
             raise ValueError(msg)
     if max_ is not None:
         if (include_max and obj > max_) or (not include_max and obj >= max_):
+            caller_name, line_num = _callerInfo()
             lt = '<=' if include_min else '<'
             msg = msg if msg is not None else f"function '{caller_name}:{line_num}' requires {obj} {lt} {max_}"
             raise ValueError(msg)